@@ -7,17 +7,14 @@
 # Version: 1.3.2                                                #
 # Date: 2024-04-12                                              #
 # License: BSDL                                                 #
-# Requirements: paramiko for SFTP                               #
+# Requirements: paramiko 3.3 or later for SFTP                  #
 # Command: pip3 install paramiko                                #
 #################################################################
 
 ## Common parameters.
 
-vMigrateDir: str = ""          # Where to put the files during migration for further processing, must be same path at receiving server.
-vCleanMigrateDir: str = "No"   # Should we automatically clean the migration folder when done?
 vEnvDir: str = ""              # Where container env parameter files resides on both servers, must match on both sides and is not a temporary folder.
-vSecDir: str = ""              # Secret directory where secret files reside during migration only, each file must match the secret name(s) used on the container.
-vFilePrefix: str = "migrate"   # Prefix for backups during migration, do not add _ at the end, that is added later.
+vSecDir: str = ""              # Local secret directory where secret files reside during migration only, each file must match the secret name(s) used on the container.
 vSftpUseKeyFile: str = "No"    # Use a keyfile or username & password when connection to remote server.
 vSftpKeyFilePath: str = ""     # Set to full path where your key files reside, only used if vSftpUseKeyFile is set to Yes.
 vAcceptDisclaimer: str = "No"  # Set to Yes to not show the disclaimer, but please read it first.
@@ -26,13 +23,19 @@ vAcceptDisclaimer: str = "No"  # Set to Yes to not show the disclaimer, but plea
 
 ## Module Import
 from datetime import datetime
+import concurrent.futures
 import subprocess
+import threading
+import queue
+import functools
 import argparse
 import paramiko
 import getpass
+import socket
+import shlex
+import json
 import time
 import sys
-import re
 import os
 
 ## Get required input parameters.
@@ -46,6 +49,8 @@ if vSftpUseKeyFile.lower() == "yes":
   parser.add_argument('--keyfile', required=True, dest='sKey', type=str, help='name of key file to use when connecting to remote server.')
 elif vSftpUseKeyFile.lower() == "no":
   parser.add_argument('--keyfile', required=False, dest='sKey', type=str, help='name of key file to use when connecting to remote server.')
+parser.add_argument('--assume-yes', required=False, dest='sAssumeYes', action='store_true', help='Answer yes to every question, run without prompts.')
+parser.add_argument('--on-conflict', required=False, dest='sOnConflict', type=str, default='ask', choices=['ask', 'continue', 'abort'], help='What to do when a secret or network is missing or already exist on remote server, continue creates a missing network (values: ask/continue/abort).')
 # Check argument length.
 if len(sys.argv)==1:
   parser.print_help(sys.stderr)
@@ -57,6 +62,8 @@ vInputType: str = str(args.sType)
 vInputDest: str = str(args.sDest)
 vInputPort: str = str(args.sPort)
 vInputKey: str = str(args.sKey)
+vInputAssumeYes: bool = args.sAssumeYes
+vInputOnConflict: str = str(args.sOnConflict)
 
 #### Global variables ####
 
@@ -64,20 +71,67 @@ vInputKey: str = str(args.sKey)
 
 # Container create command.
 vGlobContainerCreateCmd: str = None
+# Container create command split into arguments.
+vGlobContainerCreateArgs: list = []
 # Pod create command.
 vGlobPodCreateCmd: str = None
 # Network name.
 vGlobNetworkName: str = None
-# Require list.
-vGlobRequireList: list = []
+# Require dict, the containers each pod container requires keyed by container name.
+vGlobRequireDict: dict = {}
+# Parsed container inspect data, keyed by container name.
+vGlobInspectCache: dict = {}
+# Parsed pod inspect data, keyed by pod name.
+vGlobPodInspectCache: dict = {}
+# Known remote container existence, keyed by container name.
+vGlobRemoteExistCache: dict = {}
+# SSH channel window this side advertises, only limits data the server sends us (downloads), uploads are bound by the server window.
+vGlobSshWindowSize: int = 134217727
+# SSH channel max packet size, 32KB is what OpenSSH accepts per SFTP packet.
+vGlobSshPacketSize: int = 32768
+# Bytes/packets before the SSH session rekeys, raised so big tarballs do not stall mid transfer.
+vGlobSshRekeyLimit: int = pow(2, 40)
+# Block size read from local files/streams before handing it to paramiko, larger blocks stop helping after 1MB.
+vGlobBlockSize: int = 1 << 20
+# Max blocks read ahead of the remote writer when streaming, keeps the link busy while the source is slow.
+vGlobStreamDepth: int = 8
+# Ciphers tried first on the data connection, AES has hardware support on most CPUs and is faster than chacha20 there.
+vGlobDataCiphers: tuple = ("aes128-gcm@openssh.com", "aes256-gcm@openssh.com", "aes128-ctr", "aes256-ctr")
+# Seconds between SSH keepalive packets, keeps the connection up during long local exports.
+vGlobSshKeepAlive: int = 30
+# Number of SSH connections opened to the remote server, pod containers are migrated this many at a time.
+vGlobSshPoolSize: int = 4
+# Idle SSH connections used by the remote command functions, take one with get() and hand it back with put() when done.
+vGlobSshPool: queue.Queue = queue.Queue()
+# Every opened SSH connection, used for closing since the pool only holds the idle ones.
+vGlobSshClients: list = []
+# Uncompressed SSH connection for streamed data and SFTP, every stream gets its own channel on it.
+vGlobDataClient: paramiko.SSHClient = None
+# Max number of volumes transferred at the same time.
+vGlobTransferWorkers: int = 4
+# Max outstanding SFTP read requests when getting files, 64 is the sweet spot, unbounded is up to 20x slower.
+vGlobSftpPrefetch: int = 64
+# Number of SFTP clients opened on the connection so transfers in different threads do not wait on each other.
+vGlobSftpPoolSize: int = 4
+# Idle SFTP clients, take one with get() and hand it back with put() when done.
+vGlobSftpPool: queue.Queue = queue.Queue()
+# Running image save processes, killed by funcImageStop when the migration halts during the image sync.
+vGlobImageSaves: list = []
+# Set by funcImageStop so no new image save is started.
+vGlobImageStop: threading.Event = threading.Event()
+# Max open sessions per SSH connection, the OpenSSH MaxSessions default.
+vGlobSshMaxSessions: int = 10
+# Free sessions for streams on the data connection, the SFTP clients hold the rest for the whole run.
+vGlobDataSessions: threading.BoundedSemaphore = threading.BoundedSemaphore(vGlobSshMaxSessions - vGlobSftpPoolSize)
+# Podman run/create long options that do not take a separate value, used to find the image in a create command.
+vGlobPodmanBoolFlags: tuple = ("--detach", "--interactive", "--tty", "--rm", "--privileged", "--init", "--read-only", "--read-only-tmpfs", "--replace", "--no-healthcheck", "--no-hosts", "--quiet", "--publish-all", "--oom-kill-disable", "--env-host", "--http-proxy", "--sig-proxy", "--rootfs", "--passwd", "--tls-verify", "--disable-content-trust", "--rmi", "--unsetenv-all")
+# Podman run/create short options that do not take a value.
+vGlobPodmanBoolShort: str = "ditPq"
+# Marker used to split up the output of batched remote commands.
+vGlobBatchMarker: str = "__oMigrate_rc__"
 
 #### General functions ####
 
-## Function - Get current date.
-def funcDateString() -> datetime:
-  # Returns the today string year, month, day.
-  return datetime.now().strftime("%Y%m%d")
-
 # Function - Get current time.
 def funcTimeString() -> datetime:
   # Returns the today string year, month, day.
@@ -85,15 +139,16 @@ def funcTimeString() -> datetime:
 
 # Function - General error message.
 def funcErrorMsg(vType: str) -> None:
+  # Build the whole message first and write it with a single print.
   print(
-    "\n",
-    "MIGRATION FAILED!!!",
-    "If you are seeing this message it means that somewhere in the process the migration failed.\n",
-    "The source " + vType + " still exits and can be used if needed so do not worry about that.\n",
-    "\n",
-    "Before trying to migrate again, you need to manually check what exists on the remote server \n",
-    "and manually removing any files, settings specific to the failed migration.",
-    "\n",
+    "\n"
+    "MIGRATION FAILED!!!\n"
+    "If you are seeing this message it means that somewhere in the process the migration failed.\n"
+    "The source " + vType + " still exits and can be used if needed so do not worry about that.\n"
+    "\n"
+    "Before trying to migrate again, you need to manually check what exists on the remote server\n"
+    "and manually removing any files, settings specific to the failed migration.\n"
+    "\n"
     "Remember to read the error message generated during the migration process, it can lead you to where things went wrong."
   )
   # Just return nothing, will output the word "None" if this do not exist.
@@ -101,33 +156,47 @@ def funcErrorMsg(vType: str) -> None:
 
 # Function - Yes/No
 def funcYesNo(vQuestion: str) -> str:
-  vReply: str = str(input(vQuestion+' (y/n): ')).lower().strip()
-  if vReply[0] == 'y':
+  # Do not prompt when --assume-yes is given.
+  if vInputAssumeYes:
+    print(vQuestion + " (y/n): y")
+    return "1"
+  # Ask until we get a valid answer, loop instead of recursing so the stack never grows.
+  while True:
+    vReply: str = str(input(vQuestion+' (y/n): ')).lower().strip()
+    if vReply[:1] == 'y':
+      return "1"
+    if vReply[:1] == 'n':
+      return "0"
+    vQuestion = "Please enter only [y] or [n]..."
+
+# Function - Yes/No for conflicts, answered by --on-conflict if set so the migration never waits on a prompt.
+def funcConflict(vQuestion: str) -> str:
+  if vInputOnConflict == "continue":
+    print(vQuestion + " (y/n): y")
     return "1"
-  if vReply[0] == 'n':
+  elif vInputOnConflict == "abort":
+    print(vQuestion + " (y/n): n")
     return "0"
   else:
-    return funcYesNo("Please enter only [y] or [n]...")
+    return funcYesNo(vQuestion)
 
 ## Function - Disclaimer.
 def funcDisclaimer() -> None:
   if vAcceptDisclaimer.lower() == "no":
+    # Build the whole message first and write it with a single print.
     print(
-      "Disclaimer!!!\n",
-      "This script has been tested as much as possible, but there are no guarantees that it will work in every situation.\n",
-      "The script uses built in podman commands to retrieve various information before proceeding.\n",
-      "\n",
-      "Beware that volumes that contain symlinks within the filesystem experience an issue with podman and can result in missing\n",
-      "files on the destination server when a volume is restored.\n",
-      "\n",
-      "Path on local server and remote server must match 100% for the parameter vMigrateDir, this means that you need to\n",
-      "have the same path on both servers.\n",
-      "\n",
-      "You need to run this script with the users running your containers both locally and for the remote SFTP session\n",
-      "since this script tries to go the full line of migrating and starting the container at hand.\n",
-      "\n",
-      "To hide this disclaimer you can set the vAcceptDisclaimer parameter to Yes...\n",
-      "\n",
+      "Disclaimer!!!\n"
+      "This script has been tested as much as possible, but there are no guarantees that it will work in every situation.\n"
+      "The script uses built in podman commands to retrieve various information before proceeding.\n"
+      "\n"
+      "Beware that volumes that contain symlinks within the filesystem experience an issue with podman and can result in missing\n"
+      "files on the destination server when a volume is restored.\n"
+      "\n"
+      "You need to run this script with the users running your containers both locally and for the remote SFTP session\n"
+      "since this script tries to go the full line of migrating and starting the container at hand.\n"
+      "\n"
+      "To hide this disclaimer you can set the vAcceptDisclaimer parameter to Yes...\n"
+      "\n"
       "Choose [y] to continue or choose [n] to exit.\n"
     )
     vGetOption: str = funcYesNo("Continue?")
@@ -143,120 +212,123 @@ def funcDisclaimer() -> None:
 
 ## Function - EndMessage
 def funcEndMessage() -> None:
-  # Build path and last row info.
-  if vCleanMigrateDir.lower() == "no":
-    if len(vSecDir) != 0:
-      vPath: str = vMigrateDir + ", " + vSecDir
-      vLastRows: str = "The following folder(s) needs to be cleaned out manually on both sides for now.\n Folder(s): " + vPath
-    else:
-      vPath: str = vMigrateDir
-      vLastRows: str = "The following folder(s) needs to be cleaned out manually on both sides for now.\n Folder(s): " + vPath
+  # Build last row info.
+  # Secrets are streamed straight into the remote secret store, the files only exist on this server.
+  if len(vSecDir) != 0:
+    vLastRows: str = "The following folder needs to be cleaned out manually on this server.\nFolder: " + vSecDir
   else:
-    if len(vSecDir) != 0:
-      vPath: str = vSecDir
-      vLastRows: str = "The following folder(s) needs to be cleaned out manually on both sides for now.\n Folder(s): " + vPath
-    else:
-      vLastRows: str = "No folder(s) needs to be cleaned out manually, bye..."
+    vLastRows: str = "No folder(s) needs to be cleaned out manually, bye..."
   # Determine if migration is a pod or a single container.
   if vInputType.lower() == "container":
-    print(
-      "Migration Done!!!\n",
-      "Please verify everything on the destination server.\n",
-      "\n",
-      "The container still exist on this server if migration failed on any step and can be restarted if needed.\n",
-      "The local container needs to be manually removed when all test on migrated system is done and confirmed as working.\n",
-      "\n",
-      vLastRows
+    vBody: str = (
+      "The container still exist on this server if migration failed on any step and can be restarted if needed.\n"
+      "The local container needs to be manually removed when all test on migrated system is done and confirmed as working.\n"
     )
   elif vInputType.lower() == "pod":
-    print(
-      "Migration Done!!!\n",
-      "Please verify everything on the destination server.\n",
-      "\n",
-      "The pod still exist on this server if migration failed on any step and can be restarted if needed.\n",
-      "The local pod and attached containers needs to be manually removed when all test on migrated\n",
-      "system is done and confirmed as working.\n",
-      "\n",
-      vLastRows
+    vBody: str = (
+      "The pod still exist on this server if migration failed on any step and can be restarted if needed.\n"
+      "The local pod and attached containers needs to be manually removed when all test on migrated\n"
+      "system is done and confirmed as working.\n"
     )
+  # Build the whole message first and write it with a single print.
+  print(
+    "Migration Done!!!\n"
+    "Please verify everything on the destination server.\n"
+    "\n" + vBody +
+    "\n" + vLastRows
+  )
   # Return nothing to remove it adding the word "None" to the output
   return ""
 
-## Function - Check migration folder.
-def funcCheckMigrateFolder() -> None:
-  print("Checking to see that migration folder is empty...")
-  # Check status of folder.
-  if os.listdir(vMigrateDir) == []:
-    print("Folder is empty, continuing...")
-  else:
-    print("Folder is not empty, recommended not to continue without cleaning it first...")
-    vGetOption: str = funcYesNo("Continue?")
-    if vGetOption == "0":
-      # Output message
-      print("Halting migration...")
-      exit(0)
-    else:
-      print("You chose to continue, errors generated from here on could be due to the migration folder not being empty...")
-      time.sleep(5)
-  # Just return nothing, will output the word "None" if this do not exist.
-  return ""
-
-## Function - Clean local migration folder.
-def funcCleanLocalMigrateFolder() -> None:
-  # check if vCleanMigrateDir is Yes.
-  if vCleanMigrateDir.lower() == "yes":
-    # Clean the folder.
-    print("Cleaning local migration folder...")
-    for fname in os.listdir(vMigrateDir):
-      os.remove(os.path.join(vMigrateDir, fname))
-    print("Cleaned local migration folder...")
-  elif vCleanMigrateDir.lower() == "no":
-    # Do not clean the folder.
-    print("Not cleaning local migration folder...")
-
-## Function - Clean remote migration folder.
-def funcCleanRemoteMigrateFolder() -> None:
-  if vCleanMigrateDir.lower() == "yes":
-    # Check to see if migration folder is empty, 1 = not empty & 0 = empty.
-    vCmdLine: str = '[ "$(ls -A ' + vMigrateDir + ')" ] && echo "1" || echo "0"'
-    vRemoteStatus: list = funcSftpCmdRL(vCmdLine, "Checking to see that there is something to clean in remote migration folder...")
-    # Check if return status is equal to 1
-    if vRemoteStatus[1] == "1":
-      vCmdLine: str = "rm " + vMigrateDir + "/*"
-      # Run the command and get status.
-      vRemoteStatus: list = funcSftpCmdRL(vCmdLine, "Trying to clean migration folder on remote server...")
-      if "No such file or directory" in vRemoteStatus[1]:
-        print("Could not clean migration folder on remote server, please check why...")
-        print("Error from command:\n", vRemoteStatus[1])
-      else:
-        print("Cleaned remote migration folder...")
-    else:
-      print("Folder is already empty nothing to clean...")
-  elif vCleanMigrateDir.lower() == "no":
-    # Do not clean the folder.
-    print("Not cleaning remote migration folder...")
-
 #### SFTP Functions ####
 
+## Function - Create SSH transport with tuned window and rekey limits.
+def funcSftpTransport(vSock: socket.socket, vData: bool = False, **vArgs) -> paramiko.Transport:
+  # Used as transport_factory for SSHClient.connect so the settings apply before key exchange.
+  vTransport = paramiko.Transport(vSock, default_window_size=vGlobSshWindowSize, default_max_packet_size=vGlobSshPacketSize, **vArgs)
+  vTransport.packetizer.REKEY_BYTES = vGlobSshRekeyLimit
+  vTransport.packetizer.REKEY_PACKETS = vGlobSshRekeyLimit
+  if vData:
+    # Put the fast ciphers first, keep the rest as fallback so key exchange still works if the server has none of them.
+    vOptions = vTransport.get_security_options()
+    vPreferred: list = [vCipher for vCipher in vGlobDataCiphers if vCipher in vOptions.ciphers]
+    vOptions.ciphers = vPreferred + [vCipher for vCipher in vOptions.ciphers if vCipher not in vPreferred]
+  return vTransport
+
+## Function - Open tuned SSH connection to remote server.
+def funcSftpOpenClient(vAuth: dict, vData: bool = False) -> paramiko.SSHClient:
+  # Open the TCP socket ourselves to disable Nagle, the socket buffers are left to kernel autotuning.
+  vSock = socket.create_connection((vInputDest, int(vInputPort)))
+  vSock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+  vClient = paramiko.SSHClient()
+  vClient.set_missing_host_key_policy(paramiko.AutoAddPolicy())
+  # Compress command connections, command output and inspect data compress well.
+  # Data connections carry bulk binary data, do not spend CPU compressing it.
+  vTransportFactory = functools.partial(funcSftpTransport, vData=vData)
+  vClient.connect(vInputDest, port=vInputPort, sock=vSock, transport_factory=vTransportFactory, compress=not vData, **vAuth)
+  # The connection is reused for every command, do not let NAT or firewalls drop it while idle.
+  vClient.get_transport().set_keepalive(vGlobSshKeepAlive)
+  return vClient
+
+## Function - Copy a local stream to a remote writer in large blocks.
+def funcStreamCopy(vSource, vWrite) -> None:
+  # Read in a separate thread so the next blocks are ready while the current one is being sent.
+  vBlocks: queue.Queue = queue.Queue(maxsize=vGlobStreamDepth)
+  vStop: threading.Event = threading.Event()
+  def funcReadBlocks() -> None:
+    try:
+      while not vStop.is_set():
+        vBuf: bytes = vSource.read(vGlobBlockSize)
+        vBlocks.put(vBuf)
+        if not vBuf:
+          break
+    except OSError as vErr:
+      # Hand the error over to the writer side.
+      vBlocks.put(vErr)
+  vReader: threading.Thread = threading.Thread(target=funcReadBlocks, daemon=True)
+  vReader.start()
+  try:
+    while True:
+      vBuf = vBlocks.get()
+      if isinstance(vBuf, OSError):
+        raise vBuf
+      if not vBuf:
+        break
+      # Pass a memoryview, paramiko slices the data per 32KB packet and slicing bytes copies the rest every time.
+      vWrite(memoryview(vBuf))
+  finally:
+    # If the writer failed the reader may be waiting on a full queue, empty it until the reader is done.
+    vStop.set()
+    while vReader.is_alive():
+      try:
+        vBlocks.get(timeout=0.1)
+      except queue.Empty:
+        pass
+
 ## Function - Connect via SFTP.
 def funcSftpConnect() -> None:
   try:
-    global vScpClient
-    vScpClient = paramiko.SSHClient()
-    vScpClient.set_missing_host_key_policy(paramiko.AutoAddPolicy())
+    global vGlobDataClient
     # Check if to ask for username & password or to use keyfile.
     if vSftpUseKeyFile.lower() == "no":
       print('Enter Username & Password for remote server...')
       vUser: str = input('Username: ')
       vPass: str = getpass.getpass('Password: ')
-      vScpClient.connect(vInputDest, port=vInputPort, username=vUser, password=vPass)
+      vAuth: dict = {"username": vUser, "password": vPass}
     elif vSftpUseKeyFile.lower() == "yes":
       print('Using KeyFile to connect to remote server...')
       vKeyFile: str = paramiko.RSAKey.from_private_key_file(vSftpKeyFilePath + "/" + vInputKey)
-      vScpClient.connect(vInputDest, port=vInputPort, pkey=vKeyFile, look_for_keys=False)
-    # Open connection
-    global vScpConn
-    vScpConn = vScpClient.open_sftp()
+      vAuth: dict = {"pkey": vKeyFile, "look_for_keys": False}
+    # Open a pool of connections with the same credentials so remote commands from different threads run side by side.
+    for vIndex in range(vGlobSshPoolSize):
+      vSshClient: paramiko.SSHClient = funcSftpOpenClient(vAuth)
+      vGlobSshClients.append(vSshClient)
+      vGlobSshPool.put(vSshClient)
+    # Separate uncompressed connection for streams and SFTP, also carries the SFTP clients.
+    vGlobDataClient = funcSftpOpenClient(vAuth, True)
+    # Open a pool of SFTP clients, each one is its own channel on the same connection.
+    for vIndex in range(vGlobSftpPoolSize):
+      vGlobSftpPool.put(paramiko.SFTPClient.from_transport(vGlobDataClient.get_transport(), window_size=vGlobSshWindowSize, max_packet_size=vGlobSshPacketSize))
     print('Connected to ' + vInputKey + '...')
   except:
     print('Cannot connect to remote server, exiting...')
@@ -268,24 +340,59 @@ def funcSftpSend(vSftpFile: str, vShowMsg: str) -> None:
   try:
     print(vShowMsg)
     print('Sending file: ' + vSftpFile)
-    vScpConn.put(vSftpFile, vSftpFile)
+    # A SFTP client may only be used by one thread at a time, borrow one from the pool.
+    vScpConn: paramiko.SFTPClient = vGlobSftpPool.get()
+    try:
+      # Stream the file ourselves with pipelined writes, put() waits for every 32KB chunk to be acknowledged.
+      with open(vSftpFile, 'rb') as vSrc, vScpConn.file(vSftpFile, 'wb') as vDst:
+        vDst.set_pipelined(True)
+        funcStreamCopy(vSrc, vDst.write)
+    finally:
+      vGlobSftpPool.put(vScpConn)
     print('Sent Ok...')
   except OSError as vErr:
     print('Could not send file...')
     print(vErr)
 
+## Function - Get file via SFTP.
+def funcSftpGet(vRemoteFile: str, vLocalFile: str, vShowMsg: str) -> None:
+  try:
+    print(vShowMsg)
+    print('Getting file: ' + vRemoteFile)
+    # A SFTP client may only be used by one thread at a time, borrow one from the pool.
+    vScpConn: paramiko.SFTPClient = vGlobSftpPool.get()
+    try:
+      vScpConn.get(vRemoteFile, vLocalFile, prefetch=True, max_concurrent_prefetch_requests=vGlobSftpPrefetch)
+    finally:
+      vGlobSftpPool.put(vScpConn)
+    print('Got Ok...')
+  except OSError as vErr:
+    print('Could not get file...')
+    print(vErr)
+
+## Function - Run command on a pooled SSH connection, return exit status, output and error output.
+def funcSftpExec(vSftpCmd: str) -> list:
+  # Borrow a connection from the pool, a connection is only used by one thread at a time.
+  vSshClient: paramiko.SSHClient = vGlobSshPool.get()
+  try:
+    stdin_, stdout_, stderr_ = vSshClient.exec_command(vSftpCmd)
+    # Read both streams before asking for the exit status, stdout & stderr share the channel so ask once.
+    vOut: str = stdout_.read().decode("utf-8")
+    vErr: str = stderr_.read().decode("utf-8")
+    vStatus: int = stdout_.channel.recv_exit_status()
+    return vStatus, vOut, vErr
+  finally:
+    vGlobSshPool.put(vSshClient)
+
 ## Function - Run command via SFTP, return exit status and the message.
 def funcSftpCmdRS(vSftpCmd: str, vShowMsg: str) -> list:
   try:
     print(vShowMsg)
     print("Command: " + vSftpCmd)
-    stdin_, stdout_, stderr_ = vScpClient.exec_command(vSftpCmd)
-    # Get exit status and return it.
-    vStatus: str = stdout_.channel.recv_exit_status()
-    vErrCode: int = stderr_.channel.recv_exit_status()
-    if vErrCode != 0:
-      vReturnMsg: str = "Error message:\n" + stderr_.read().decode("utf-8").strip()
-      return vErrCode, vReturnMsg
+    vStatus, vOut, vErr = funcSftpExec(vSftpCmd)
+    if vStatus != 0:
+      vReturnMsg: str = "Error message:\n" + vErr.strip()
+      return vStatus, vReturnMsg
     else:
       print("Command finished OK...")
       # To keep it consistent with 2 return statuses.
@@ -299,45 +406,136 @@ def funcSftpCmdRL(vSftpCmd: str, vShowMsg: str) -> list:
   try:
     print(vShowMsg)
     print("Command: " + vSftpCmd)
-    stdin_, stdout_, stderr_ = vScpClient.exec_command(vSftpCmd)
+    vStatus, vOut, vErr = funcSftpExec(vSftpCmd)
     # Get returning lines.
-    vLines: list = stdout_.readlines()
-    # Get exit status.
-    vStatus: int = stdout_.channel.recv_exit_status()
-    vErrCode: int = stderr_.channel.recv_exit_status()
-    if vErrCode != 0:
-      vReturnMsg:str = "Error message:\n" + stderr_.read().decode("utf-8").strip()
-      return vErrCode, vReturnMsg
-    elif vErrCode == 0:
-      if len(vLines) > 0:
-        if vLines:
-          for vLine in vLines:
-            vClean01: str = re.sub("\\[\\'", '', vLine)
-            vClean02: str = re.sub("\\'\\]\n", '', vClean01)
-            vClean03:str  = re.sub("\n", '', vClean02)
-            return vStatus, vClean03
-      else:
-        return vStatus, "None"
+    vLines: list = vOut.splitlines()
+    if vStatus != 0:
+      vReturnMsg:str = "Error message:\n" + vErr.strip()
+      return vStatus, vReturnMsg
+    elif not vLines:
+      return vStatus, "None"
+    else:
+      # Clean and return every line, not only the first one.
+      vClean: list = []
+      for vLine in vLines:
+        vLine = vLine[2:] if vLine.startswith("['") else vLine
+        vClean.append(vLine[:-2] if vLine.endswith("']") else vLine)
+      return vStatus, "\n".join(vClean)
   except OSError as vErr:
     print(vErr)
 
+## Function - Run command via SFTP with data streamed to its stdin, return exit status and the message.
+def funcSftpCmdStream(vSftpCmd: str, vSource, vShowMsg: str) -> list:
+  try:
+    print(vShowMsg)
+    print("Command: " + vSftpCmd)
+    # Streams go over the data connection, each one on its own channel so several can run at the same time.
+    # Wait for a free session so the server never refuses a channel, pod containers and volumes are streamed in parallel.
+    with vGlobDataSessions:
+      stdin_, stdout_, stderr_ = vGlobDataClient.exec_command(vSftpCmd)
+      vSendErr: str = ""
+      try:
+        # Feed the remote command while the data is being read locally.
+        funcStreamCopy(vSource, stdin_.channel.sendall)
+        # Tell the remote command there is no more data.
+        stdin_.channel.shutdown_write()
+      except OSError as vErr:
+        # Usually the remote command stopped early and closed the channel, its exit status and stderr tell why.
+        vSendErr = str(vErr)
+      # Get exit status and return it.
+      vStatus: int = stdout_.channel.recv_exit_status()
+      vErrMsg: str = stderr_.read().decode("utf-8").strip() if vStatus != 0 or vSendErr else ""
+      # Close the channel before the session is handed to the next stream.
+      stdout_.channel.close()
+    if vStatus != 0 or vSendErr:
+      vReturnMsg: str = "Error message:\n" + (vErrMsg or vSendErr)
+      # A failed send is an error even if the remote command exited 0.
+      return vStatus or 1, vReturnMsg
+    print("Command finished OK...")
+    return vStatus, "OK"
+  # A refused channel is an SSHException, not an OSError.
+  except (OSError, paramiko.SSHException) as vErr:
+    print(vErr)
+    # Keep it consistent with 2 return statuses so callers can report the failure.
+    return 1, str(vErr)
+
+## Function - Run several commands in one remote session, return exit status and output for each command.
+def funcSftpCmdBatch(vSftpCmds: list, vShowMsg: str) -> list:
+  try:
+    print(vShowMsg)
+    # Every command prints its exit status behind a marker so the output can be split up again.
+    vParts: list = []
+    for vSftpCmd in vSftpCmds:
+      print("Command: " + vSftpCmd)
+      vParts.append("{ " + vSftpCmd + " ; } 2>&1 ; echo \"" + vGlobBatchMarker + "$?\"")
+    # Each command's own status sits behind its marker, the session status and stderr are not needed.
+    _, vOut, _ = funcSftpExec(" ; ".join(vParts))
+    # Collect output lines until the marker for each command shows up.
+    vResults: list = []
+    vOutput: list = []
+    for vLine in vOut.splitlines():
+      vHead, vMarker, vTail = vLine.partition(vGlobBatchMarker)
+      if vHead:
+        vOutput.append(vHead)
+      if vMarker:
+        vResults.append((int(vTail), "\n".join(vOutput)))
+        vOutput = []
+    return vResults
+  except OSError as vError:
+    print(vError)
+
+## Function - Poll a remote status command until the output contains vWanted or vWait seconds have passed, return the last status.
+def funcSftpCmdWait(vSftpCmd: str, vWanted: str, vWait: int, vShowMsg: str) -> list:
+  print("Waiting up to " + str(vWait) + " seconds for '" + vWanted + "'...")
+  vDeadline: float = time.monotonic() + vWait
+  # Start with short delays so a fast start is seen right away, then back off.
+  vDelay: float = 0.25
+  while True:
+    vRemoteStatus: list = funcSftpCmdRL(vSftpCmd, vShowMsg)
+    vLeft: float = vDeadline - time.monotonic()
+    if vRemoteStatus[0] != 0 or vWanted in vRemoteStatus[1] or vLeft <= 0:
+      return vRemoteStatus
+    time.sleep(min(vDelay, vLeft))
+    vDelay *= 2
+
 ## Function - Close SFTP connection.
 def funcSftpClose() -> None:
   try:
     print("Closing remote session...")
-    vScpConn.close()
+    while not vGlobSftpPool.empty():
+      vGlobSftpPool.get().close()
+    for vSshClient in vGlobSshClients:
+      vSshClient.close()
+    vGlobDataClient.close()
     print("Remote session closed...")
   except OSError as vErr:
     print(vErr)
 
 #### Container functions ####
 
+## Function - Get container inspect data, cached since every field comes from the same document.
+def funcLoadInspect(vName: str) -> dict:
+  if vName not in vGlobInspectCache:
+    vRunCmd = subprocess.run(["podman", "container", "inspect", vName], capture_output=True, text=True)
+    # Return empty data if the container do not exist, do not cache it.
+    if vRunCmd.returncode != 0:
+      return {}
+    vGlobInspectCache[vName] = json.loads(vRunCmd.stdout)[0]
+  return vGlobInspectCache[vName]
+
+## Function - Load inspect data for several containers with one podman call.
+def funcPreloadInspect(vNames: list) -> None:
+  vMissing: list = [vName for vName in vNames if vName not in vGlobInspectCache]
+  if vMissing:
+    vRunCmd = subprocess.run(["podman", "container", "inspect", *vMissing], capture_output=True, text=True)
+    # Podman still prints the containers it found if one is missing, funcLoadInspect handles the rest one by one.
+    if vRunCmd.stdout.strip():
+      for vData in json.loads(vRunCmd.stdout):
+        vGlobInspectCache[vData["Name"]] = vData
+
 ## Function - Check if container exist locally, exit if not.
 def funcContainerExistLocal() -> None:
-  vCmdLine: str = "podman container inspect " + vInputName + " --format {{.Name}}"
-  vRunCmd = subprocess.Popen(vCmdLine, shell=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-  vCmdData: list = vRunCmd.stdout.readlines()
-  if len(vCmdData) == 0:
+  if not funcLoadInspect(vInputName):
     print("No matching container found, exiting...")
     print(funcErrorMsg("container"))
     exit(1)
@@ -346,74 +544,129 @@ def funcContainerExistLocal() -> None:
 
 ## Function - Check if container exist on remote server.
 def funcContainerExistRemote(vName: str, vLoop: bool) -> int:
-  vCmdLine: str = "podman container list --all --filter name=" + vName + " --format {{.Names}}"
-  # Run the command and get status.
-  vRemoteStatus: list = funcSftpCmdRL(vCmdLine, "Checking to see if container already exist on remote server...")
-  if vRemoteStatus[1].strip() == vName:
+  # Only ask the remote server if we do not already know.
+  if vName not in vGlobRemoteExistCache:
+    vCmdLine: str = "podman container list --all --filter name=" + vName + " --format {{.Names}}"
+    # Run the command and get status.
+    vRemoteStatus: list = funcSftpCmdRL(vCmdLine, "Checking to see if container already exist on remote server...")
+    # The name filter is a regex and can list more containers, look for an exact match.
+    vExists: bool = vName in vRemoteStatus[1].splitlines()
+    # Only remember the answer if the command worked.
+    if vRemoteStatus[0] == 0:
+      vGlobRemoteExistCache[vName] = vExists
+  else:
+    vExists: bool = vGlobRemoteExistCache[vName]
+  if vExists:
     # If used in loop we shall not break script.
-    if vLoop.lower() == "false":
-      print("Container " + vRemoteStatus[1].strip() + " already exist on remote server, exiting...")
+    if not vLoop:
+      print("Container " + vName + " already exist on remote server, exiting...")
       print(funcErrorMsg("container"))
       exit(1)
     else:
         # Return status 1 for loop functions.
-        return "1"
+        return 1
   else:
     print("Container do not seem to exist on remote server, continuing...")
     # Return status 0 for loop functions.
-    return "0"
-
-## Function - Get container create command.
+    return 0
+
+## Function - Find where the image is in a podman run/create argument list, every argument after it belongs to the container command.
+def funcGetImageIndex(vArgs: list, vStart: int) -> int:
+  vIndex: int = vStart
+  while vIndex < len(vArgs):
+    vArg: str = vArgs[vIndex]
+    if vArg == "--":
+      return vIndex + 1
+    if not vArg.startswith("-") or vArg == "-":
+      return vIndex
+    if vArg.startswith("--"):
+      # "--option=value" and flags without value take one argument, the rest also take the next one.
+      if "=" not in vArg and vArg not in vGlobPodmanBoolFlags:
+        vIndex += 1
+    else:
+      # Short options can be grouped like -dit, the first one that takes a value uses the rest or the next argument.
+      for vPos, vLetter in enumerate(vArg[1:], 1):
+        if vLetter not in vGlobPodmanBoolShort:
+          if vPos == len(vArg) - 1:
+            vIndex += 1
+          break
+    vIndex += 1
+  return vIndex
+
+## Function - Get container create command, cached per container.
+@functools.lru_cache(maxsize=None)
 def funcGetCntCreateCmd(vName: str) -> str:
   try:
-    vCmdLine: str = "podman container inspect " + vName + " --format {{.Config.CreateCommand}}"
-    vRunCmd = subprocess.Popen(vCmdLine, shell=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-    vCmdData: list = vRunCmd.stdout.readlines()
-    for vCntCreate in vCmdData:
-      vClean01: str = re.sub('\\[', '', vCntCreate.decode("utf-8").strip())
-      vClean02: str = re.sub(']', '', vClean01)
-      # Change "run" to "create" and remove "--detach"
-      vClean03: str = vClean02.replace("run", "create")
-      vClean04: str = vClean03.replace(" --detach", "")
-      # Fix for custom sh start command with $ in them.
-      vClean05: str = vClean04.replace('sh -c ', 'sh -c "')
-      vClean06: str = vClean05.replace('$', '\$')
-      # Add the final " at the end only if...
-      if "sh -c" in vClean06:
-        vClean07: str = vClean06 + '"'
-        # Output.
-        return vClean07
-      else:
-        # Output.
-        return vClean06
+    vArgs: list = list(funcLoadInspect(vName)["Config"]["CreateCommand"])
+    # Find the sub command, "podman run" or "podman container run".
+    vSub: int = 2 if vArgs[1:2] == ["container"] else 1
+    # Change "run" to "create".
+    if vArgs[vSub] == "run":
+      vArgs[vSub] = "create"
+    # Remove "--detach" from the podman options only, never touch the container command after the image.
+    vImage: int = funcGetImageIndex(vArgs, vSub + 1)
+    vOptions: list = []
+    for vArg in vArgs[vSub + 1:vImage]:
+      if vArg in ("-d", "--detach") or vArg.startswith("--detach="):
+        continue
+      # Drop d from grouped short flags like -dit or -dp 80:80, only among the flags before one that takes a value.
+      if vArg.startswith("-") and not vArg.startswith("--"):
+        vFlags: str = vArg[1:]
+        vEnd: int = 0
+        while vEnd < len(vFlags) and vFlags[vEnd] in vGlobPodmanBoolShort:
+          vEnd += 1
+        vArg = "-" + vFlags[:vEnd].replace("d", "") + vFlags[vEnd:]
+        if vArg == "-":
+          continue
+      vOptions.append(vArg)
+    vArgs = vArgs[:vSub + 1] + vOptions + vArgs[vImage:]
+    # Quote every argument so custom sh -c start commands with $ in them survive the remote shell.
+    return shlex.join(vArgs)
   except:
     print("Cannot get create command, exiting...")
     print(funcErrorMsg("container"))
     exit(1)
 
-## Function - Get volume names.
+## Function - Set container create command globals.
+def funcSetCntCreateCmd(vName: str) -> None:
+  global vGlobContainerCreateCmd
+  global vGlobContainerCreateArgs
+  vGlobContainerCreateCmd = funcGetCntCreateCmd(vName)
+  # Split it once so the helpers can look up options without scanning the string again.
+  vGlobContainerCreateArgs = shlex.split(vGlobContainerCreateCmd)
+
+## Function - Get every value given to an option in the container create command.
+def funcGetCreateOption(vOption: str, vArgs: list = None) -> list:
+  # Use the current container unless another argument list is given.
+  if vArgs is None:
+    vArgs = vGlobContainerCreateArgs
+  # Only read the podman options, the container command after the image can hold look-alike options like "-v".
+  vSub: int = 2 if vArgs[1:2] in (["container"], ["pod"]) else 1
+  vArgs = vArgs[:funcGetImageIndex(vArgs, vSub + 1)]
+  vValues: list = []
+  for vIndex, vArg in enumerate(vArgs):
+    # Handle both "--option value" and "--option=value".
+    if vArg == vOption and vIndex + 1 < len(vArgs):
+      vValues.append(vArgs[vIndex + 1])
+    elif vArg.startswith(vOption + "="):
+      vValues.append(vArg[len(vOption) + 1:])
+  return vValues
+
+## Function - Get volume names, cached per container.
+@functools.lru_cache(maxsize=None)
 def funcGetCntVolName(vName: str) -> list:
   try:
-    # Get create command.
-    vGetCreateString: str = vGlobContainerCreateCmd
+    # Use the create command of vName itself so the cached result never depends on the current container.
+    vArgs: list = shlex.split(funcGetCntCreateCmd(vName))
     # Return the volume if exist, else return None as value
-    if '--volume' in str(vGetCreateString) or '-v' in str(vGetCreateString):
+    if funcGetCreateOption("--volume", vArgs) or funcGetCreateOption("-v", vArgs):
      # Volume Name List
       vNameList: list = []
-      # CMD
-      vCmdLine: str = "podman container inspect " + vName + " --format {{.Mounts}}"
-      vRunCmd = subprocess.Popen(vCmdLine, shell=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-      vCmdData: str = vRunCmd.stdout.readlines()
-      vList: str = str(vCmdData[0])
-      # Split the volume data.
-      vSplit: list = vList.split('} {')
-      # Loop through the data.
-      for vRow in vSplit:
-        # Clean the volume data.
-        vCleanStart: str = re.sub('.*volume ', '', vRow)
-        vCleanEnd: str = re.sub(' .*', '', vCleanStart)
-        # Add to list.
-        vNameList.append(vCleanEnd)
+      # Loop through the mounts and keep the volumes.
+      for vMount in funcLoadInspect(vName)["Mounts"]:
+        if vMount["Type"] == "volume":
+          # Add to list.
+          vNameList.append(vMount["Name"])
       # Return the finished list.
       return vNameList
     else:
@@ -429,23 +682,25 @@ def funcGetCntVolName(vName: str) -> list:
 def funcSyncContainer(vName: str, vLoop: bool) -> list:
   try:
     print("Getting container '" + vName + "' create command...")
-    vCreateCmd: str = vGlobContainerCreateCmd
+    # Look it up by name instead of using the global, pod containers are synced from several threads.
+    vCreateCmd: str = funcGetCntCreateCmd(vName)
     # Run the remote command and get result..
     vMessage: str = "Creating container '" + vName + "' on remote server..."
     vRemoteStatus: list = funcSftpCmdRS(vCreateCmd, vMessage)
     # Check return status.
     if vRemoteStatus[0] == 0:
       print("Container created on remote server...")
-      return "0", "OK"
+      vGlobRemoteExistCache[vName] = True
+      return 0, "OK"
     else:
-      if vLoop.lower() != "true":
+      if not vLoop:
         print("Cannot create container on remote server...")
         print(vRemoteStatus[1])
         print(funcErrorMsg("container"))
         exit(1)
       else:
         # Return that we could not create container.
-        return "1", vRemoteStatus[1]
+        return 1, vRemoteStatus[1]
   except:
     print("Cannot migrate container, exiting...")
     print(funcErrorMsg("container"))
@@ -453,19 +708,15 @@ def funcSyncContainer(vName: str, vLoop: bool) -> list:
 
 ## Function - Get container Pod membership.
 def funcGetPodStatus() -> None:
-  vCmdLine: str = "podman container inspect " + vInputName + " --format {{.Pod}}"
-  vRunCmd = subprocess.Popen(vCmdLine, shell=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-  vCmdData: str = vRunCmd.stdout.readlines()
-  # Check length of returned data.
-  vCmdDataExp: str = vCmdData[0].decode("utf-8").strip()
+  # Check length of returned pod id.
+  vCmdDataExp: str = funcLoadInspect(vInputName)["Pod"]
   if len(vCmdDataExp) > 1:
     # Get name from ID
-    vCmdLine: str = "podman pod inspect " + vCmdDataExp + " --format {{.Name}}"
-    vRunCmd: str = subprocess.Popen(vCmdLine, shell=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-    vCmdPod: str = vRunCmd.stdout.readlines()
+    vRunCmd = subprocess.run(["podman", "pod", "inspect", vCmdDataExp, "--format", "{{.Name}}"], capture_output=True, text=True)
+    vCmdPod: list = vRunCmd.stdout.splitlines()
     for vPodName in vCmdPod:
       # Output.
-      print("This container is a member of the following pod: '" + vPodName.decode("utf-8").strip() + "', cannot migrate it as a single container, use Pod migration option instead, exiting...")
+      print("This container is a member of the following pod: '" + vPodName.strip() + "', cannot migrate it as a single container, use Pod migration option instead, exiting...")
       print(funcErrorMsg("container"))
       exit(1)
   else:
@@ -474,20 +725,19 @@ def funcGetPodStatus() -> None:
 ## Function - Stop container.
 def funcStopContainer() -> str:
   print("Stopping local container...")
-  vCmdLine: str = "podman container stop " + vInputName
-  vRunCmd = subprocess.Popen(vCmdLine, shell=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-  vCmdOut: list = vRunCmd.stdout.readlines()
-  vCmdErr: list = vRunCmd.stderr.readlines()
+  vRunCmd = subprocess.run(["podman", "container", "stop", vInputName], capture_output=True, text=True)
+  vCmdOut: list = vRunCmd.stdout.splitlines()
+  vCmdErr: list = vRunCmd.stderr.splitlines()
   if vCmdOut:
     for vData in vCmdOut:
-      vName: str = vData.decode("utf-8").strip()
+      vName: str = vData.strip()
       if vName.lower() == vInputName.lower():
         return "Container stopped OK..."
       else:
         return vName
   if vCmdErr:
     for vError in vCmdErr:
-      return vError.decode("utf-8").strip()
+      return vError.strip()
 
 ## Function - Start remote container.
 def funcStartContainer(vName: str, vWait: int) -> None:
@@ -496,95 +746,65 @@ def funcStartContainer(vName: str, vWait: int) -> None:
   # Run command without asking for return status.
   vMessage: str = "Starting container '" + vName + "' on remote server..."
   funcSftpCmdRS(vCmdLine, vMessage)
-  # Sleep on given time in seconds before checking status.
-  print("Sleeping " + str(vWait) + " seconds before continuing...")
-  time.sleep(vWait)
-  # Check if container is running.
+  # Check if container is running, poll until it is up or vWait seconds have passed.
   vCmdCheckLine: str = "podman ps --filter name=" + vName + " --format {{.Status}}"
   # Run the command and get status.
-  vRemoteStatus: list = funcSftpCmdRL(vCmdCheckLine, "Checking to see if the remote container is still running...")
+  vRemoteStatus: list = funcSftpCmdWait(vCmdCheckLine, "Up", vWait, "Checking to see if the remote container is still running...")
   if vRemoteStatus[0] == 0:
     if "Up" in vRemoteStatus[1]:
       print("Container is running...")
     else:
       print("Could not get status of container, error message:\n", vRemoteStatus[1])
 
-## Function - Volume Backup.
-def funcVolumeBackup(vGetVolName: str) -> list:
-  try:
-    # Backup list.
-    vFileList: list = []
-    # Do the volume backups.
-    for vName in vGetVolName:
-      print("Backing up volume: ", vName)
-      vCmdLine: str = "podman volume export --output"
-      vSetTarFile=os.path.join(vMigrateDir, vFilePrefix + "_" + vName + "_" + funcDateString() + ".tar")
-      # Execute export of volumes.
-      vCmd: str = (vCmdLine + " " + vSetTarFile + " " + vName)
-      subprocess.run(vCmd, shell=True, check=True)
-      # Add to list.
-      vFileList.append(vSetTarFile)
-    # Return the list.
-    return vFileList
-  except:
-    # Send info to console and exit.
-    print("Could not export one or more volumes, exiting...")
-    print(funcErrorMsg(vInputType.lower()))
-    exit(1)
-
 ## Function - Transfer container image.
 def funcImageSync(vName: str) -> None:
   try:
     ## Get container image
     print("Getting image from '" + vName + "' container...")
-    vCmdLine: str = "podman container inspect " + vName + " --format {{.ImageName}}"
-    vRunCmd = subprocess.Popen(vCmdLine, shell=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-    vCmdData: list = vRunCmd.stdout.readlines()
-    for vImg in vCmdData:
-      # Clean input.
-      vImgSource: str =  vImg.decode("utf-8").strip()
-    # CMD
-    vCmdLine: str = "podman image inspect " + vImgSource + " --format {{.Id}}"
-    # Get local image Id.
-    vImgIdLocal = subprocess.run(vCmdLine, shell=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-    # Get remote image Id.
-    vImgIdRemote: list = funcSftpCmdRL(vCmdLine, "Checking to see if image already exist on remote server...")
+    vImgSource: str = funcLoadInspect(vName)["ImageName"]
+    # The container inspect already holds the image Id, no need to ask podman for it.
+    vImgId: str = funcLoadInspect(vName)["Image"]
+    # Nothing more to sync when the migration is halting.
+    if vGlobImageStop.is_set():
+      return
+    # If the same image Id exist on remote server just make sure it has the name the container uses.
+    vCmdLine: str = "podman image exists " + vImgId + " && podman image tag " + vImgId + " " + vImgSource
+    vImgRemote: list = funcSftpCmdRS(vCmdLine, "Checking to see if image already exist on remote server...")
     # Check if images match.
-    if vImgIdLocal.stdout.decode("utf-8").strip() == vImgIdRemote[1]:
+    if vImgRemote[0] == 0:
       print("Image is already in sync, no need to transfer image...")
     else:
-      ## Save image locally.
       print("Image is not synced...")
-      print("Saving image '" + vImgSource + "' to file...")
-      # Clean image name.
-      vClean1: str = vImgSource.replace(".", "_")
-      vClean2: str = vClean1.replace("/", "_")
-      vName: str = vClean2.replace(":", "_")
-      # CMD.
-      vCmdLine: str = "podman image save --format docker-archive --quiet --output"
-      # Build path & filename.
-      vSetTarFile: str = os.path.join(vMigrateDir, vFilePrefix + "_img_" + vName + "_" + funcDateString() + ".tar")
-      # Check if image already been saved, skip if yes.
-      vFileExist: bool = os.path.isfile(vSetTarFile)
-      if vFileExist != True:
-        # Execute image save.
-        vCmd: str = (vCmdLine + " " + vSetTarFile + " " + vImgSource)
-        subprocess.run(vCmd, shell=True, check=True)
-        # Send image to remote server.
-        funcSftpSend(vSetTarFile, "Syncing image to remote server...")
-        # Import image on remote server.
-        vCmdImport: str = "podman image load --input " + vSetTarFile
-        # Run the remote command and get result.
-        vRemoteStatus: list = funcSftpCmdRS(vCmdImport, "Importing image on remote server...")
-        if vRemoteStatus[0] != 0:
-          print("Could not import image on remote server, error:\n", vRemoteStatus[1])
-      else:
-        print("Image export already exist in migration folder, assuming it has already been synced, skipping...")
+      print("Streaming image '" + vImgSource + "' to remote server...")
+      # Pipe the save straight into the remote load, nothing is staged on disk on either side.
+      vSave = subprocess.Popen(["podman", "image", "save", "--format", "docker-archive", "--quiet", vImgSource], stdout=subprocess.PIPE)
+      vGlobImageSaves.append(vSave)
+      # The migration may have halted while the save was starting.
+      if vGlobImageStop.is_set():
+        vSave.kill()
+      # Run the remote command and get result.
+      vRemoteStatus: list = funcSftpCmdStream("podman image load", vSave.stdout, "Importing image on remote server...")
+      vSave.stdout.close()
+      vSaveStatus: int = vSave.wait()
+      vGlobImageSaves.remove(vSave)
+      # Check the remote side first, if the load stopped early the save is killed by SIGPIPE as a side effect.
+      if vRemoteStatus[0] != 0:
+        print("Could not import image on remote server, error:\n", vRemoteStatus[1])
+      elif vSaveStatus != 0:
+        # Let the handler below print the error and exit.
+        print("Could not save image '" + vImgSource + "'...")
+        raise subprocess.CalledProcessError(vSaveStatus, vSave.args)
   except:
     print("Could not sync container image, exiting...")
     print(funcErrorMsg("container"))
     exit(1)
 
+## Function - Stop the image sync, kill running image saves so the remote load ends and nothing waits on it.
+def funcImageStop() -> None:
+  vGlobImageStop.set()
+  for vSave in list(vGlobImageSaves):
+    vSave.kill()
+
 ## Function - Initialize containers.
 def funcInitContainer(vName: str) -> None:
   try:
@@ -597,101 +817,92 @@ def funcInitContainer(vName: str) -> None:
     print("Cannot Initialize the following container: " + vName)
     print(vCmdErr)
 
+## Function - Stream a single volume to remote server and restore it.
+def funcVolumeTransfer(vVolName: str) -> None:
+  print("Backing up volume: ", vVolName)
+  # Pipe the export straight into the remote import, nothing is staged on disk on either side.
+  vExport = subprocess.Popen(["podman", "volume", "export", vVolName], stdout=subprocess.PIPE)
+  vCmd: str = "podman volume import " + vVolName + " -"
+  # Run the remote command and get result.
+  vRemoteStatus: list = funcSftpCmdStream(vCmd, vExport.stdout, "Streaming volume to remote server...")
+  vExport.stdout.close()
+  vExportStatus: int = vExport.wait()
+  # Check the remote side first, if the import stopped early the export is killed by SIGPIPE as a side effect.
+  if vRemoteStatus[0] != 0:
+    print("Could not import volume on remote server, error:\n", vRemoteStatus[1])
+  elif vExportStatus != 0:
+    # Send info to console and exit.
+    print("Could not export volume '" + vVolName + "', exiting...")
+    print(funcErrorMsg(vInputType.lower()))
+    exit(1)
+
 ## Function - Volume send and restore.
 def funcVolSendRestore(vName: str, vType: str) -> None:
-  try:
-    # Determine if called for pod or container.
+  # Determine if called for pod or container.
+  if vType == "container":
+    vWorkVolume = funcGetCntVolName(vName)
+  elif vType == "pod":
+    vWorkVolume = funcGetPodVolName(vName)
+  # Check parameter status.
+  if vWorkVolume != "None":
+    print("Checking '" + vName + "' for volumes...")
+    # Transfer volumes in parallel, each one on its own remote channel.
+    with concurrent.futures.ThreadPoolExecutor(max_workers=vGlobTransferWorkers) as vPool:
+      vJobs: list = [vPool.submit(funcVolumeTransfer, vVolName) for vVolName in vWorkVolume]
+      # Wait for every volume, raises the exit from a failed export here.
+      for vJob in vJobs:
+        vJob.result()
+  else:
     if vType == "container":
-      vWorkVolume = funcGetCntVolName(vName)
+      print("Container '" + vName + "'has no volume(s) attached, continuing...")
     elif vType == "pod":
-      vWorkVolume = funcGetPodVolName(vName)
-    # Check parameter status.
-    if vWorkVolume != "None":
-      # Backup returns the full filepath of every
-      # volume backup taken for further processing.
-      print("Checking '" + vName + "' for volumes...")
-      vBackupVolFiles: list = funcVolumeBackup(vWorkVolume)
-      # Send each backup.
-      for vFile in vBackupVolFiles:
-        funcSftpSend(vFile, "Sending volume backup...")
-      # Restore volumes on remote machine.
-      for vFile in vBackupVolFiles:
-        vCleanStart: str = re.sub('.*\\/' + vFilePrefix + '\\_', '', vFile)
-        vCleanEnd: str = re.sub('_' + '[0-9].*', '', vCleanStart)
-        vCmd: str = "podman volume import " + vCleanEnd + ' ' + vFile
-        # Run the remote command and get result.
-        vRemoteStatus: list = funcSftpCmdRS(vCmd, "Importing volume on remote server...")
-        if vRemoteStatus[0] != 0:
-          print("Could not import volume on remote server, error:\n", vRemoteStatus[1])
-    else:
-      if vType == "container":
-        print("Container '" + vName + "'has no volume(s) attached, continuing...")
-      elif vType == "pod":
-        print("Pod has no volume(s) attached, continuing...")
-  except OSError as vCmdErr:
-    print("Cannot restore the following volume: " + vCleanEnd)
-    print(vCmdErr)
+      print("Pod has no volume(s) attached, continuing...")
 
 ## Function - Check current env path against vEnvDir.
 def funcGetContainerEnvFilePath() -> list:
-  #vCntCreateString = funcGetCntCreateCmd(vName)
-  vCntCreateString: str = vGlobContainerCreateCmd
-  if "--env-file" in str(vCntCreateString):
-    # Clean the env path.
-    vClean01: str = re.sub('.*env\\-file ', '', vCntCreateString)
-    vClean02: str = re.sub(' .*', '', vClean01)
-    # Split and create a list
-    vList: list = vClean02.split("/")
-    # Remove first index in list.
-    del vList[0]
-    # Get length of list and subtract 1
-    vLength: int = len(vList) - 1
-    # Remove last index in list.
-    del vList[vLength]
-    # Merge list back to one string.
-    vFinal: str = "/" + "/".join(vList)
-    return vFinal
+  # Return the folder holding each env file.
+  vFolders: list = []
+  for vFile in funcGetCreateOption("--env-file"):
+    vFolders.append(os.path.dirname(vFile))
+  return vFolders
 
 ## Function - Check and sync env file if used.
 def funcSyncContainerEnvFile() -> None:
   # Start with checking if vEnvDir is set.
   if len(vEnvDir) != 0:
-    # Get global variable.
-    vCreateString: str = vGlobContainerCreateCmd
-    # Check if --env-file is used.
-    if "--env-file" in str(vCreateString):
-      print("Container '" + funcPodGetCntName() + "' has ENV file...")
-      # Clean the env path.
-      vClean01: str = re.sub('.*env\\-file ', '', vCreateString)
-      vClean02: str = re.sub(' .*', '', vClean01)
-      # Return current path.
-      vFile: str = vClean02
-      # Check if current path matches VEnvDir
+    # Check if --env-file is used, it can be given more than once.
+    vEnvFiles: list = funcGetCreateOption("--env-file")
+    if vEnvFiles:
+      print("Container '" + funcPodGetCntName() + "' has ENV file(s)...")
+      # Check if current path matches VEnvDir for every file.
       vContEnvFile: list = funcGetContainerEnvFilePath()
-      if vContEnvFile == vEnvDir:
-        # Check to see if a file with same name already exist on both sides.
-        vCmdLine: str = "test -f " + vFile + " ; echo $?"
-        # Run the command on local server and get status.
-        vRunCmd = subprocess.Popen(vCmdLine, shell=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-        vCmdData: list = vRunCmd.stdout.readlines()
-        if vCmdData[0].strip().decode("utf-8") == "1":
-          print("No local ENV file found, exiting...")
+      if all(vFolder == vEnvDir for vFolder in vContEnvFile):
+        # Check the local server directly, no need to start a shell for it.
+        vMissing: list = [vFile for vFile in vEnvFiles if not os.path.isfile(vFile)]
+        if vMissing:
+          print("No local ENV file found:", str(vMissing)[1:-1] + ", exiting...")
           print(funcErrorMsg("container"))
           exit(1)
         else:
-          print("Local ENV file exists, continuing...")
-        # Run the command on remote server and get status.
-        vRemoteStatus: list = funcSftpCmdRL(vCmdLine, "Checking to see if ENV file already exist on remote server...")
-        vCleanRS: str = re.sub('\n', '', vRemoteStatus[1])
-        if vCleanRS == "0":
-          print("ENV file already exist on remote server, skipping sync...")
-        elif vCleanRS == "1":
-          print("ENV file do not exist on remote server...")
-          # Sync env file to remote host.
-          funcSftpSend(vFile, "Sending ENV file to remote server...")
+          print("Local ENV file(s) exists, continuing...")
+        # Check every file on the remote server in one session.
+        vCmdLines: list = ["test -f " + vFile for vFile in vEnvFiles]
+        vRemoteList: list = funcSftpCmdBatch(vCmdLines, "Checking to see if ENV file(s) already exist on remote server...")
+        # Every file needs its own answer, a broken session would otherwise skip files without a word.
+        if vRemoteList is None or len(vRemoteList) != len(vEnvFiles):
+          print("Could not check ENV file(s) on remote server, exiting...")
+          print(funcErrorMsg("container"))
+          exit(1)
+        for vFile, vRemoteStatus in zip(vEnvFiles, vRemoteList):
+          if vRemoteStatus[0] == 0:
+            print("ENV file '" + vFile + "' already exist on remote server, skipping sync...")
+          else:
+            print("ENV file '" + vFile + "' do not exist on remote server...")
+            # Sync env file to remote host.
+            funcSftpSend(vFile, "Sending ENV file to remote server...")
       else:
         print("vEnvDir:", vEnvDir)
-        print("Container:", vContEnvFile)
+        print("Container:", str(vContEnvFile)[1:-1])
         print("Different sources for ENV file, container not matching vEnvDir variable, exiting...")
         print(funcErrorMsg("container"))
         exit(1)
@@ -702,32 +913,29 @@ def funcSyncContainerEnvFile() -> None:
 
 ## Function - Check and sync container secrets.
 def funcSyncContainerSecret(vName: str) -> None:
-  # Get global parameter
-  vCreateString: str = vGlobContainerCreateCmd
+  # Get every --secret option from the container.
+  vSecrets: list = funcGetCreateOption("--secret")
   print("Checking '" + vName + "' for secret(s)...")
   # Check to see if secret is used.
-  if "--secret" in str(vCreateString):
+  if vSecrets:
     # check if vSecDir is set.
     if len(vSecDir) != 0:
       # List for secrets
       vAllSecrets: list = []
-      # Get every secret name from container
-      vSplit: list = vCreateString.split(" --")
-      for vSecret in vSplit:
-        if "secret " in vSecret:
-          vClean01: str = re.sub('secret ', '', vSecret)
-          vClean02: str = re.sub('\\,.*', '', vClean01)
-          vAllSecrets.append(vClean02)
+      for vSecret in vSecrets:
+        # Keep the secret name, drop any ,type=...,target=... options.
+        vAllSecrets.append(vSecret.partition(',')[0])
       # Remove brackets from list for presentation.
       vSecList: list = str(vAllSecrets)[1:-1]
       # List for return statuses
       vSecRStatus: list = []
       # Check to see if there are a secret file(s) for the container under vSecDir.
       for vSec in vAllSecrets:
-        vCmdLine: str = "test -f " + vSecDir + "/" + vSec + " ; echo $?"
-        vRunCmd = subprocess.run(vCmdLine, shell=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-        # Get return status.
-        vSecRStatus.append(int(vRunCmd.stdout.decode("utf-8").strip()))
+        # Get return status, 0 = exists & 1 = missing.
+        if os.path.isfile(vSecDir + "/" + vSec):
+          vSecRStatus.append(0)
+        else:
+          vSecRStatus.append(1)
       # Check return status
       if 1 in vSecRStatus:
         # When secret file do not exist.
@@ -739,62 +947,46 @@ def funcSyncContainerSecret(vName: str) -> None:
           print("This is what we found:", vSecList)
         else:
           print("Make sure you named it correct, this is what we found:", vSecList)
-        input("To continue without secret file choose [y] or choose [n] to halt migration.")
-        vGetOption: str = funcYesNo("Continue?")
+        print("To continue without secret file choose [y] or choose [n] to halt migration.")
+        vGetOption: str = funcConflict("Continue?")
         if vGetOption == "0":
           # Output error message
           print(funcErrorMsg("container"))
           exit(1)
       elif 0 in vSecRStatus:
-        # Iterate through all of the secrets, send and import them one by one.
+        # Stream every secret file into the remote secret store, nothing is written to disk on the remote server.
+        vRemSecList: list = []
         for vSec in vAllSecrets:
-          # Check path on remote server.
-          vCmdLine: str = "test -d " + vSecDir + " ; echo $?"
-          vRemoteStatus: list = funcSftpCmdRL(vCmdLine, "Checking that remote path exist and matches vSecDir parameter...")
-          vCleanRS: str = re.sub('\n', '', vRemoteStatus[1])
-          if vCleanRS == "0":
-            # Send Secret file over to remote server.
-            vFilePath: str = vSecDir + "/" + vSec
-            funcSftpSend(vFilePath,"Sending secret..")
-            # Import secret on remote server.
-            vCmdLine: str = "podman secret create " + vSec + " " + vSecDir + "/" + vSec
-            # import secret into secret store.
-            vRemSecStatus: list = funcSftpCmdRL(vCmdLine,"Creating secret on remote server...")
-            # Checking return status.
-            if vRemSecStatus[0] != 0:
-              print("Could not create the following secret:", vSec)
-              print("Error from remote command:\n")
-              print(vRemSecStatus[1].strip() + "\n")
-              if "secret name in use" in vRemSecStatus[1]:
-                print("If the secret on the remote server is for this container you can choose to continue.")
-                input("To continue using the existing secret choose [y] or choose [n] to halt migration.")
-                vGetOption: str = funcYesNo("Continue?")
-                if vGetOption == "0":
-                  # Output error message
-                  print(funcErrorMsg("container"))
-                  exit(1)
-              elif "no such file or directory" in vRemSecStatus[1]:
-                print("Did we send the files properly?, check status further up...")
-                print("Cannot continue, exiting...")
-                print(funcErrorMsg("container"))
-                exit(1)
-              else:
-                print("Unknown error, cannot continue, exiting...")
+          with open(vSecDir + "/" + vSec, 'rb') as vSecFile:
+            vCmdLine: str = "podman secret create " + vSec + " -"
+            vRemSecList.append(funcSftpCmdStream(vCmdLine, vSecFile, "Creating secret '" + vSec + "' on remote server..."))
+        # Checking return status for each secret.
+        for vSec, vRemSecStatus in zip(vAllSecrets, vRemSecList):
+          if vRemSecStatus[0] != 0:
+            print("Could not create the following secret:", vSec)
+            print("Error from remote command:\n")
+            print(vRemSecStatus[1].strip() + "\n")
+            if "secret name in use" in vRemSecStatus[1]:
+              print("If the secret on the remote server is for this container you can choose to continue.")
+              print("To continue using the existing secret choose [y] or choose [n] to halt migration.")
+              vGetOption: str = funcConflict("Continue?")
+              if vGetOption == "0":
+                # Output error message
                 print(funcErrorMsg("container"))
                 exit(1)
             else:
-              print("Secret imported on remote server...")
-          elif vCleanRS == "1":
-            print("Remote directory do not exist, please validate, exiting...")
-            print(funcErrorMsg("container"))
-            exit(1)
+              print("Unknown error, cannot continue, exiting...")
+              print(funcErrorMsg("container"))
+              exit(1)
+          else:
+            print("Secret '" + vSec + "' imported on remote server...")
     else:
       # When vSecDir is not set.
       print("Container is using --secret parameter(s) but vSecDir is not set.")
       print("You can choose to continue, ignoring secret sync, this is ok only IF you already")
       print("have created the secret on the destination server, otherwise the container will fail to start.")
-      input("To continue without syncing secret choose [y] or choose [n] to halt migration.\n")
-      vGetOption: str = funcYesNo("Continue?")
+      print("To continue without syncing secret choose [y] or choose [n] to halt migration.")
+      vGetOption: str = funcConflict("Continue?")
       if vGetOption == "0":
         # Output error message
         print(funcErrorMsg("container"))
@@ -804,16 +996,13 @@ def funcSyncContainerSecret(vName: str) -> None:
 
 ## Function - Check and sync network.
 def funcSyncNetwork(vName: str) -> str:
-  # Get global variable.
-  vCreateString: str = vGlobContainerCreateCmd
+  # Get every network option given, both "--network name" and "--network=name".
+  vNetworks: list = funcGetCreateOption("--network")
   # Check to see if the network option is used.
-  if '--network ' in vGlobContainerCreateCmd:
+  if vNetworks:
     print("The container '" + vName + "' uses the --network option...")
-    # Get network name.
-    vClean01: str = re.sub('.*network ', '', vCreateString)
-    vClean02: str = re.sub(' .*', '', vClean01)
-    # Return network name.
-    vNetName: str = vClean02
+    # Get network name, the last one given wins.
+    vNetName: str = vNetworks[-1]
     # Check to see if we already created the network as per pod migration.
     global vGlobNetworkName
     if vGlobNetworkName != vNetName:
@@ -829,7 +1018,7 @@ def funcSyncNetwork(vName: str) -> str:
           "If the network is for this container you can choose [y] to continue,\n"
           "and to use existing network, else choose [n] to halt the migration process.\n"
         )
-        vGetOption: str = funcYesNo("Continue?")
+        vGetOption: str = funcConflict("Continue?")
         if vGetOption == "0":
           # Output error message
           print(funcErrorMsg("container"))
@@ -849,7 +1038,12 @@ def funcSyncNetwork(vName: str) -> str:
           "Choose [y] to let us create the network or choose [n] when you have\n"
           "manually created the network on the remote server to continue."
         )
-        vGetOption: str = funcYesNo("Let us create the network?")
+        # With --on-conflict=abort a missing network halts, "n" would go on without it.
+        if vInputOnConflict == "abort":
+          print("Network '" + vNetName + "' is missing on the remote server, halting as per --on-conflict...")
+          print(funcErrorMsg("container"))
+          exit(1)
+        vGetOption: str = funcConflict("Let us create the network?")
         if vGetOption == "1":
           # Add network name to global.
           vGlobNetworkName = vNetName
@@ -875,12 +1069,24 @@ def funcSyncNetwork(vName: str) -> str:
 
 #### Pod functions ####
 
+## Function - Get pod inspect data, cached since every field comes from the same document.
+def funcLoadPodInspect(vName: str) -> dict:
+  if vName not in vGlobPodInspectCache:
+    vRunCmd = subprocess.run(["podman", "pod", "inspect", vName], capture_output=True, text=True)
+    # Return empty data if the pod do not exist, do not cache it.
+    if vRunCmd.returncode != 0:
+      return {}
+    vData = json.loads(vRunCmd.stdout)
+    # Podman 5 returns a list, older versions a single object.
+    if isinstance(vData, list):
+      vData = vData[0]
+    vGlobPodInspectCache[vName] = vData
+  return vGlobPodInspectCache[vName]
+
 ## Function - Check if pod exist.
 def funcPodExistLocal(vName: str) -> None:
-  vCmdLine: str = "podman pod inspect " + vName + " --format {{.Name}}"
-  vRunCmd = subprocess.Popen(vCmdLine, shell=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-  vCmdData: list = vRunCmd.stdout.readlines()
-  if len(vCmdData) == 0:
+  # The inspect data is needed later anyway, so loading it doubles as the existence check.
+  if not funcLoadPodInspect(vName):
     print("No matching pod found, cannot continue, exiting...")
     print(funcErrorMsg("pod"))
     exit(1)
@@ -889,27 +1095,21 @@ def funcPodExistLocal(vName: str) -> None:
 
 ## Function - Pod exist on remote server.
 def funcPodExistRemote(vName: str) -> None:
-  vCmdLine: str = "podman pod inspect " + vName + " --format {{.Name}}"
-  vRemoteStatus: list = funcSftpCmdRL(vCmdLine, "Checking to see if container already exist on remote server...")
-  if vRemoteStatus[0] != "0":
-    if vRemoteStatus[1].strip() == vName:
-      print("Pod already exist on remote server, exiting...")
-      print(funcErrorMsg("pod"))
-      exit(1)
-    else:
-      print("Container do not seem to exist on remote server, continuing...")
+  # Exit status 0 means the pod exist, no output to parse.
+  vCmdLine: str = "podman pod exists " + vName
+  vRemoteStatus: list = funcSftpCmdRS(vCmdLine, "Checking to see if pod already exist on remote server...")
+  if vRemoteStatus[0] == 0:
+    print("Pod already exist on remote server, exiting...")
+    print(funcErrorMsg("pod"))
+    exit(1)
+  else:
+    print("Pod do not seem to exist on remote server, continuing...")
 
 ## Function - Get pod create command.
 def funcGetPodCreateCmd(vName: str) -> str:
   try:
-    vCmdLine: str = "podman pod inspect " + vName + " --format {{.CreateCommand}}"
-    vRunCmd = subprocess.Popen(vCmdLine, shell=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-    vCmdData: list = vRunCmd.stdout.readlines()
-    for vPodCreate in vCmdData:
-      vCleanStart: str = re.sub('\\[', '', vPodCreate.decode("utf-8").strip())
-      vCleanEnd: str = re.sub(']', '', vCleanStart)
-      # Output.
-      return vCleanEnd
+    # Quote every argument so values with spaces survive the remote shell.
+    return shlex.join(funcLoadPodInspect(vName)["CreateCommand"])
   except:
     print("Cannot get create command, exiting...")
     print(funcErrorMsg("pod"))
@@ -918,22 +1118,10 @@ def funcGetPodCreateCmd(vName: str) -> str:
 ## Function - Get pod containers.
 def funcGetPodContainers(vName: str) -> list:
   try:
-    # Name list
-    vNameList: list = []
-    # CMD
-    vCmdLine: str = "podman pod inspect " + vName + " --format {{.Containers}}"
-    vRunCmd = subprocess.Popen(vCmdLine, text=True, shell=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-    vCmdList: list = vRunCmd.stdout.readlines()
-    vData = str(vCmdList[0])
-    # Format data
-    vSplit: list = vData.split('} {')
-    for vRow in vSplit:
-      vClean1: str = re.sub('^\S+ ', '', vRow)
-      vClean2: str = re.sub(' .*', '', vClean1)
-      vClean3: str = re.sub('\n', '', vClean2)
-      # Add to list.
-      if "infra" not in vClean3:
-        vNameList.append(vClean3)
+    vPodData: dict = funcLoadPodInspect(vName)
+    # Every container except the infra container, matched by Id so container names with "infra" in them are kept.
+    vInfraId: str = vPodData.get("InfraContainerID", "")
+    vNameList: list = [vCnt["Name"] for vCnt in vPodData["Containers"] if vCnt["Id"] != vInfraId]
     # Output.
     return vNameList
   except:
@@ -942,11 +1130,13 @@ def funcGetPodContainers(vName: str) -> list:
     exit(1)
 
 ## Function - Sync every container image on pod.
-def funcSyncPodImages(vName: str) -> None:
-  # Get containers.
-  vListContainers: list = funcGetPodContainers(vName)
-  # Do for every container
+def funcSyncPodImages(vListContainers: list) -> None:
+  # Keep one container per image name, containers sharing an image only need it sent once.
+  vImages: dict = {}
   for vList in vListContainers:
+    vImages.setdefault(funcLoadInspect(vList)["ImageName"], vList)
+  # Do for every image
+  for vList in vImages.values():
     funcImageSync(vList)
 
 ## Function - Sync pod between servers.
@@ -965,30 +1155,21 @@ def funcSyncPod() -> None:
     print(funcErrorMsg("pod"))
     exit(1)
 
-## Function - Get pod volume names.
+## Function - Get pod volume names, cached per pod.
+@functools.lru_cache(maxsize=None)
 def funcGetPodVolName(vName: str) -> list:
   try:
     # Get create command.
-    #vGetCreateString = funcGetCntCreateCmd(vName)
-    vGetCreateString: str = vGlobPodCreateCmd
+    vArgs: list = funcLoadPodInspect(vName)["CreateCommand"]
     # Return the volume if exist, else return None as value
-    if '--volume' in str(vGetCreateString) or '-v' in str(vGetCreateString):
+    if funcGetCreateOption("--volume", vArgs) or funcGetCreateOption("-v", vArgs):
      # Volume Name list
       vNameList: list = []
-      # CMD
-      vCmdLine: str = "podman pod inspect " + vName + " --format {{.Mounts}}"
-      vRunCmd = subprocess.Popen(vCmdLine, shell=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-      vCmdData: str = vRunCmd.stdout.readlines()
-      vList: str = str(vCmdData[0])
-      # Split the volume data.
-      vSplit: list = vList.split('} {')
-      # Loop through the data.
-      for vRow in vSplit:
-        # Clean the volume data.
-        vCleanStart: str = re.sub('.*volume ', '', vRow)
-        vCleanEnd: str = re.sub(' .*', '', vCleanStart)
-        # Add to list.
-        vNameList.append(vCleanEnd)
+      # Loop through the mounts and keep the volumes, pod inspect uses a lowercase key here.
+      for vMount in funcLoadPodInspect(vName).get("mounts", []):
+        if vMount["Type"] == "volume":
+          # Add to list.
+          vNameList.append(vMount["Name"])
       # Return the finished list.
       return vNameList
     else:
@@ -1000,112 +1181,84 @@ def funcGetPodVolName(vName: str) -> list:
     print(funcErrorMsg("pod"))
     exit(1)
 
+## Function - Migrate a single pod container, create it, restore volumes and start it.
+def funcSyncPodContainer(vName: str) -> None:
+  # State what container we are working on.
+  print("Starting migration for '" + vName + "' container...")
+  # Check if it already exist on remote server.
+  if funcContainerExistRemote(vName, True) == 1:
+    print("Container '" + vName +  "' already exist on remote server, setting as migrated..")
+    return
+  # Sync container.
+  vGetStatus: list = funcSyncContainer(vName, True)
+  if vGetStatus[0] != 0:
+    print("Could not create container '" + vName + "', cannot continue, exiting...")
+    print(vGetStatus[1])
+    print(funcErrorMsg("pod"))
+    exit(1)
+  # Initialize container.
+  funcInitContainer(vName)
+  # Migrate volumes...
+  funcVolSendRestore(vName,"container")
+  # Start container...
+  funcStartContainer(vName,10)
+  # Final message.
+  print("Container '" + vName + "' migrated...")
+  print("-")
+
 ## Function - Create containers on remote server.
 def funcSyncPodContainers() -> None:
-  # Set to global.
-  global vGlobContainerCreateCmd
-  # Loop until vGlobRequireList is empty.
-  while len(vGlobRequireList) != 0:
-    # Do for every container.
-    for vCntList in vGlobRequireList:
-      # Split the data.
-      vDep: list = re.split(":", vCntList)
-      # Assign each index to a variable
-      vDepP1: str = vDep[0]
-      vDepP2: str = vDep[1]
-      vDepP3: str = vDep[2]
-      vDepP4: str = vDep[3]
-      # Check if it has dependencies to other containers
-      if vDepP2 == "1" and len(vGlobRequireList) != 1:
-        print("Container '" + vDepP1 + "' has dependencies...")
-        # Create list with required containers.
-        vReqList: list = re.split(",", vDepP4)
-        # Iterate through requirements list.
-        for vList in vReqList:
-          # State what container we are working on.
-          print("Starting migration for '" + vList + "' container...")
-          # Check if dependencies are met
-          vRemoteStatus: int = funcContainerExistRemote(vList,"true")
-          if vRemoteStatus[0] == "1":
-            print("Container '" + vList +  "' already exist on remote server, setting as migrated..")
-            # Remove from list when classified as migrated.
-            if vList in vGlobRequireList:
-              vGlobRequireList.remove(vList)
-          else:
-            # Try to migrate
-            print("Migrating '" + vList + "' to remote server...")
-            # Manipulate global variable for each container.
-            vGlobContainerCreateCmd = funcGetCntCreateCmd(vList)
-            # Sync container.
-            vGetStatus: list = funcSyncContainer(vList,"true")
-            # Check return status, if it complains about missing requirements,
-            if "cannot be used as a dependency" in vGetStatus[1]:
-              # What to do when requirement is not meet.
-              print("Requirements not satisfied for '" + vList + "', will continue and come back to this one again...")
-            elif "OK" in vGetStatus[1]:
-              # What to do when requirement is meet...
-              # Initialize container.
-              funcInitContainer(vList)
-              # Migrate volumes...
-              funcVolSendRestore(vList,"container")
-              # Start container...
-              funcStartContainer(vList,10)
-              # Remove from list when classified as migrated.
-              vReqList.remove(vList)
-              # Remove from global list.
-              vMigSearch: str = list(filter(lambda x: x.startswith(vList), vGlobRequireList))
-              vMSClean01: str = re.sub("\\[\\'","",str(vMigSearch))
-              vMSClean02: str = re.sub("\\'\\]","",vMSClean01)
-              vGlobRequireList.remove(vMSClean02)
-              print("Container '" + vList + "' migrated...")
-              print("-")
-            else:
-              print("Unknown error, cannot continue, exiting...")
-              print(vGetStatus[1])
-              print(funcErrorMsg("pod"))
-              exit(1)
-      else:
-        # State what container we are working on.
-        print("Starting migration for '" + vDepP1 + "' container...")
-        # Here we migrate the container when it has no dependencies.
-        print("No dependencies lingering for '" + vDepP1 + "', migrating container...")
-        # Manipulate global variable for each container.
-        vGlobContainerCreateCmd = funcGetCntCreateCmd(vDepP1)
-        # Sync container.
-        vGetStatus: list = funcSyncContainer(vDepP1,"true")
-        # Initialize container.
-        funcInitContainer(vDepP1)
-        # Migrate volumes...
-        funcVolSendRestore(vDepP1,"container")
-        # Start container...
-        funcStartContainer(vDepP1,10)
-        # Remove from global list.
-        vGlobRequireList.remove(vCntList)
-        # Final message.
-        print("Container '" + vDepP1 + "' migrated...")
-        print("-")
+  # Container name and the pod containers it still waits for.
+  vPending: dict = {}
+  for vName, vContainers in vGlobRequireDict.items():
+    vPending[vName] = set(vContainers)
+  # Requirements outside the pod cannot be migrated here, podman create will report them if missing.
+  for vName in vPending:
+    vPending[vName] &= vPending.keys()
+  # List the remote containers once instead of asking for every container.
+  vRemoteStatus: list = funcSftpCmdRL("podman container list --all --format {{.Names}}", "Checking which containers already exist on remote server...")
+  if vRemoteStatus[0] == 0:
+    vRemoteNames: list = vRemoteStatus[1].splitlines()
+    for vName in vPending:
+      vGlobRemoteExistCache[vName] = vName in vRemoteNames
+  # Start every container as soon as its requirements are in place, without waiting for unrelated containers.
+  with concurrent.futures.ThreadPoolExecutor(max_workers=vGlobSshPoolSize) as vPool:
+    vJobs: dict = {}
+    while vPending or vJobs:
+      # Submit every container that no longer waits for anything.
+      vReady: list = [vName for vName, vRequires in vPending.items() if not vRequires]
+      for vName in vReady:
+        del vPending[vName]
+        vJobs[vPool.submit(funcSyncPodContainer, vName)] = vName
+      if not vJobs:
+        print("Containers have circular requirements, cannot continue, exiting...")
+        print(", ".join(vPending))
+        print(funcErrorMsg("pod"))
+        exit(1)
+      vDone, vRunning = concurrent.futures.wait(vJobs, return_when=concurrent.futures.FIRST_COMPLETED)
+      for vJob in vDone:
+        # Raises the exit from a failed container here.
+        vJob.result()
+        vName: str = vJobs.pop(vJob)
+        # Nothing waits for a migrated container anymore.
+        for vRequires in vPending.values():
+          vRequires.discard(vName)
 
 ## Function - Check and sync env file if used.
-def funcSyncPodEnvFiles() -> None:
-  # Get containers.
-  vListContainers: list = funcGetPodContainers(vInputName)
+def funcSyncPodEnvFiles(vListContainers: list) -> None:
   # Do for every container
   for vList in vListContainers:
     # Manipulate global variable for each container.
-    global vGlobContainerCreateCmd
-    vGlobContainerCreateCmd = funcGetCntCreateCmd(vList)
+    funcSetCntCreateCmd(vList)
     # Sync env file.
     funcSyncContainerEnvFile()
 
 ## Function - Sync and import secret file if used.
-def funcSyncPodSecFiles(vName: str) -> None:
-  # Get containers.
-  vListContainers: list = funcGetPodContainers(vName)
+def funcSyncPodSecFiles(vListContainers: list) -> None:
   # Do for every container
   for vList in vListContainers:
     # Manipulate global variable for each container.
-    global vGlobContainerCreateCmd
-    vGlobContainerCreateCmd = funcGetCntCreateCmd(vList)
+    funcSetCntCreateCmd(vList)
     # Sync env file.
     funcSyncContainerSecret(vList)
 
@@ -1117,12 +1270,9 @@ def funcStartPod(vName: str, vWait: int) -> None:
   vRemoteStatus: list = funcSftpCmdRS(vCmdLine, vMessage)
   if vRemoteStatus[0] != 0:
       print("Could not start pod, error:\n", vRemoteStatus[1])
-  # Sleep on given time in seconds before checking status.
-  print("Sleeping " + str(vWait) + " seconds before continuing...")
-  time.sleep(vWait)
-  # Check if container is running.
+  # Check if pod is running, poll until it is or vWait seconds have passed.
   vCmdCheckLine: str = "podman pod ps --filter name=" + vName + " --format {{.Status}}"
-  vRemoteStatus: list = funcSftpCmdRL(vCmdCheckLine, "Checking to see if the pod is still running...")
+  vRemoteStatus: list = funcSftpCmdWait(vCmdCheckLine, "Running", vWait, "Checking to see if the pod is still running...")
   if "Running" in vRemoteStatus[1]:
     print("Container seems to be running...")
   elif "Degraded" in vRemoteStatus[1]:
@@ -1133,61 +1283,50 @@ def funcStartPod(vName: str, vWait: int) -> None:
 ## Function - Stop pod.
 def funcStopPod() -> str:
   print("Stopping local pod...")
-  vCmdLine: str = "podman pod stop " + vInputName
-  vRunCmd = subprocess.Popen(vCmdLine, shell=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-  vCmdOut: list = vRunCmd.stdout.readlines()
-  vCmdErr: list = vRunCmd.stderr.readlines()
+  vRunCmd = subprocess.run(["podman", "pod", "stop", vInputName], capture_output=True, text=True)
+  vCmdOut: list = vRunCmd.stdout.splitlines()
+  vCmdErr: list = vRunCmd.stderr.splitlines()
   if vCmdOut:
     for vData in vCmdOut:
-      vName: str = vData.decode("utf-8").strip()
+      vName: str = vData.strip()
       if vName.lower() == vInputName.lower():
         return "Pod stopped OK..."
       else:
         return vName
   if vCmdErr:
     for vError in vCmdErr:
-      return vError.decode("utf-8").strip()
+      return vError.strip()
 
 ## Function - Get container name.
 def funcPodGetCntName() -> str:
-  # Get create command from global.
-  vGetCmd: str = vGlobContainerCreateCmd
-  # Clean string.
-  vClean01: str = re.sub('.*\\--name ', '', vGetCmd)
-  vClean02: str = re.sub(' .*', '', vClean01)
-  return vClean02
+  # Get name from the current container arguments.
+  vNames: list = funcGetCreateOption("--name")
+  # Return "None" if the container was created without a name.
+  if vNames:
+    return vNames[-1]
+  else:
+    return "None"
 
 ## Function - Sync each container network.
-def funcPodSyncNetwork(vName: str) -> None:
-  # Get containers.
-  vListContainers: list = funcGetPodContainers(vName)
+def funcPodSyncNetwork(vListContainers: list) -> None:
   # Do for every container
   for vList in vListContainers:
     # Manipulate global variable for each container.
-    global vGlobContainerCreateCmd
-    vGlobContainerCreateCmd = funcGetCntCreateCmd(vList)
+    funcSetCntCreateCmd(vList)
     # Sync networks.
     funcSyncNetwork(vList)
 
 ## Function - Require list.
-def funcPodCntRequire(vName: str) -> None:
-  # Get containers.
-  vListContainers = funcGetPodContainers(vName)
+def funcPodCntRequire(vListContainers: list) -> None:
   # Do for every container
   for vList in vListContainers:
     # Check if they have the --require option.
-    vCreate = funcGetCntCreateCmd(vList)
-    if "--requires " in vCreate:
-      # Clean the data.
-      vCleanStart = re.sub('.*requires ', '', vCreate)
-      vCleanEnd = re.sub(' .*', '', vCleanStart)
-      # Add to list (Format: Name:Require:Migrated:Containers)
-      vListElement = vList + ":1:0:" + vCleanEnd
-      vGlobRequireList.append(vListElement)
-    else:
-      # Add to list (Format: Name:Require:Migrated:Containers)
-      vListElement = vList + ":0:0:None"
-      vGlobRequireList.append(vListElement)
+    vRequires: list = []
+    # Every --requires value can hold several comma separated containers.
+    for vValue in funcGetCreateOption("--requires", shlex.split(funcGetCntCreateCmd(vList))):
+      vRequires.extend(vValue.split(","))
+    # Add to dict (Format: Name: Containers)
+    vGlobRequireDict[vList] = vRequires
 
 #### Main functions to bind all things together ####
 
@@ -1197,66 +1336,66 @@ def funcContainerJob() -> None:
   # Step 1 - Show disclaimer if vAcceptDisclaimer is set to no.
   print("-- Step 1: TimeStamp:", funcTimeString())
   funcDisclaimer()
-  # Step 2 - Check migration folder.
+  # Step 2 - Check if local Container exist, exit if not.
   print("\n-- Step 2: TimeStamp:", funcTimeString())
-  funcCheckMigrateFolder()
-  # Step 3 - Check if local Container exist, exit if not.
-  print("\n-- Step 3: TimeStamp:", funcTimeString())
   funcContainerExistLocal()
-  # Step 4 - See if the local container is a member of a pod, exit if it is.
-  print("\n-- Step 4: TimeStamp:", funcTimeString())
+  # Step 3 - See if the local container is a member of a pod, exit if it is.
+  print("\n-- Step 3: TimeStamp:", funcTimeString())
   funcGetPodStatus()
-  # Step 5 - Fill globals with value.
-  print("\n-- Step 5: TimeStamp:", funcTimeString())
+  # Step 4 - Fill globals with value.
+  print("\n-- Step 4: TimeStamp:", funcTimeString())
   print("Assigning global parameters...")
-  global vGlobContainerCreateCmd
-  vGlobContainerCreateCmd = funcGetCntCreateCmd(vInputName)
+  funcSetCntCreateCmd(vInputName)
 
   ## Time to work
-  # Step 6 - Connect to remote server.
-  print("\n-- Step 6: TimeStamp:", funcTimeString())
+  # Step 5 - Connect to remote server.
+  print("\n-- Step 5: TimeStamp:", funcTimeString())
   funcSftpConnect()
-  # Step 7 - Check if container exist on remote server.
+  # Step 6 - Check if container exist on remote server.
+  print("\n-- Step 6: TimeStamp:", funcTimeString())
+  funcContainerExistRemote(vInputName, False)
+  # Step 7 - Sync local container image to remote server in the background, the next steps are short remote commands and prompts.
   print("\n-- Step 7: TimeStamp:", funcTimeString())
-  funcContainerExistRemote(vInputName,"false")
-  # Step 8 - Check if network is used.
-  print("\n-- Step 8: TimeStamp:", funcTimeString())
-  funcSyncNetwork(vInputName)
-  # Step 9 - Sync env file to remote server.
-  print("\n-- Step 9: TimeStamp:", funcTimeString())
-  funcSyncContainerEnvFile()
-  # Step 10 - Sync local container image to remote server.
-  print("\n-- Step 10: TimeStamp:", funcTimeString())
-  funcImageSync(vInputName)
-  # Step 11 - Transfer secrets to remote server.
-  print("\n-- Step 11: TimeStamp:", funcTimeString())
-  funcSyncContainerSecret(vInputName)
-  # Step 12 - Create container on remote server.
+  vImagePool = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+  vImageJob = vImagePool.submit(funcImageSync, vInputName)
+  try:
+    # Step 8 - Check if network is used.
+    print("\n-- Step 8: TimeStamp:", funcTimeString())
+    funcSyncNetwork(vInputName)
+    # Step 9 - Sync env file to remote server.
+    print("\n-- Step 9: TimeStamp:", funcTimeString())
+    funcSyncContainerEnvFile()
+    # Step 10 - Transfer secrets to remote server.
+    print("\n-- Step 10: TimeStamp:", funcTimeString())
+    funcSyncContainerSecret(vInputName)
+    # Step 11 - Wait for the image and create container on remote server.
+    print("\n-- Step 11: TimeStamp:", funcTimeString())
+    # Raises the exit from a failed image sync here.
+    vImageJob.result()
+  except BaseException:
+    # Halting, stop the image transfer so the exit does not wait for it.
+    funcImageStop()
+    vImagePool.shutdown(wait=False)
+    raise
+  vImagePool.shutdown()
+  funcSyncContainer(vInputName, False)
+  # Step 12 - Initialize container.
   print("\n-- Step 12: TimeStamp:", funcTimeString())
-  funcSyncContainer(vInputName,"false")
-  # Step 13 - Initialize container.
-  print("\n-- Step 13: TimeStamp:", funcTimeString())
   funcInitContainer(vInputName)
-  # Step 14 - Stop local container.
-  print("\n-- Step 14: TimeStamp:", funcTimeString())
+  # Step 13 - Stop local container.
+  print("\n-- Step 13: TimeStamp:", funcTimeString())
   funcStopContainer()
-  # Step 15 - Backup volumes if there are any & send to remote server.
-  print("\n-- Step 15: TimeStamp:", funcTimeString())
+  # Step 14 - Backup volumes if there are any & send to remote server.
+  print("\n-- Step 14: TimeStamp:", funcTimeString())
   funcVolSendRestore(vInputName,"container")
-  # Step 16 - Start container on remote server.
-  print("\n-- Step 16: TimeStamp:", funcTimeString())
+  # Step 15 - Start container on remote server.
+  print("\n-- Step 15: TimeStamp:", funcTimeString())
   funcStartContainer(vInputName,10)
-  # Step 17 - Clean folder only if vCleanMigrateDir set to Yes.
-  print("\n-- Step 17 TimeStamp:", funcTimeString())
-  funcCleanLocalMigrateFolder()
-  # Step 18 - Clean folder only if vCleanMigrateDir set to Yes.
-  print("\n-- Step 18 TimeStamp:", funcTimeString())
-  funcCleanRemoteMigrateFolder()
-  # Step 19 - End SFTP connection.
-  print("\n-- Step 19: TimeStamp:", funcTimeString())
+  # Step 16 - End SFTP connection.
+  print("\n-- Step 16: TimeStamp:", funcTimeString())
   funcSftpClose()
-  # Step 20 - Finally done.
-  print("\n-- Step 20: TimeStamp:", funcTimeString())
+  # Step 17 - Finally done.
+  print("\n-- Step 17: TimeStamp:", funcTimeString())
   funcEndMessage()
 
 ## Function - Pod Job.
@@ -1265,64 +1404,69 @@ def funcPodJob() -> None:
   # Step 1 - Show disclaimer if vAcceptDisclaimer is set to no.
   print("-- Step 1: TimeStamp:", funcTimeString())
   funcDisclaimer()
-  # Step 2 - Check migration folder.
+  # Step 2 - Check if Pod exist, will exit if not.
   print("\n-- Step 2: TimeStamp:", funcTimeString())
-  funcCheckMigrateFolder()
-  # Step 3 - Check if Pod exist, will exit if not.
-  print("\n-- Step 3: TimeStamp:", funcTimeString())
   funcPodExistLocal(vInputName)
-  # Step 4 - Fill globals with value.
-  print("\n-- Step 4: TimeStamp:", funcTimeString())
+  # Step 3 - Fill globals with value.
+  print("\n-- Step 3: TimeStamp:", funcTimeString())
   print("Assigning global parameters...")
   global vGlobPodCreateCmd
   vGlobPodCreateCmd = funcGetPodCreateCmd(vInputName)
-  funcPodCntRequire(vInputName)
+  # Get the pod containers once, every pod step works on this list.
+  vListContainers: list = funcGetPodContainers(vInputName)
+  # Inspect every pod container in one go, the later steps then read from the cache.
+  funcPreloadInspect(vListContainers)
+  funcPodCntRequire(vListContainers)
 
   ## Time to work
-  # Step 5 - Connect to remote server.
-  print("\n-- Step 5: TimeStamp:", funcTimeString())
+  # Step 4 - Connect to remote server.
+  print("\n-- Step 4: TimeStamp:", funcTimeString())
   funcSftpConnect()
-  # Step 6 - Check if pod exist on remote server.
-  print("\n-- Step 6: TimeStamp:", funcTimeString())
+  # Step 5 - Check if pod exist on remote server.
+  print("\n-- Step 5: TimeStamp:", funcTimeString())
   funcPodExistRemote(vInputName)
-  # Step 7 - Check if pod exist on remote server.
-  print("\n-- Step 7: TimeStamp:", funcTimeString())
-  funcPodSyncNetwork(vInputName)
-  # Step 8 - Sync Container images for pod containers.
-  print("\n-- Step 8: TimeStamp:", funcTimeString())
-  funcSyncPodImages(vInputName)
-  # Step 9 - Create pod on remote server.
-  print("\n-- Step 9: TimeStamp:", funcTimeString())
-  funcSyncPod()
-  # Step 10 - Sync env files to remote server.
-  print("\n-- Step 10: TimeStamp:", funcTimeString())
-  funcSyncPodEnvFiles()
-  # Step 11 - Transfer secrets to remote server.
+  # Step 6 - Sync Container images for pod containers in the background, the next steps are short remote commands and prompts.
+  print("\n-- Step 6: TimeStamp:", funcTimeString())
+  vImagePool = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+  vImageJob = vImagePool.submit(funcSyncPodImages, vListContainers)
+  try:
+    # Step 7 - Sync the networks used by the pod containers.
+    print("\n-- Step 7: TimeStamp:", funcTimeString())
+    funcPodSyncNetwork(vListContainers)
+    # Step 8 - Sync env files to remote server.
+    print("\n-- Step 8: TimeStamp:", funcTimeString())
+    funcSyncPodEnvFiles(vListContainers)
+    # Step 9 - Transfer secrets to remote server.
+    print("\n-- Step 9: TimeStamp:", funcTimeString())
+    funcSyncPodSecFiles(vListContainers)
+    # Step 10 - Wait for the images.
+    print("\n-- Step 10: TimeStamp:", funcTimeString())
+    # Raises the exit from a failed image sync here, before the remote pod is created.
+    vImageJob.result()
+  except BaseException:
+    # Halting, stop the image transfer so the exit does not wait for it.
+    funcImageStop()
+    vImagePool.shutdown(wait=False)
+    raise
+  vImagePool.shutdown()
+  # Step 11 - Create pod on remote server and stop local pod.
   print("\n-- Step 11: TimeStamp:", funcTimeString())
-  funcSyncPodSecFiles(vInputName)
-  # Step 12 - Stop pod.
-  print("\n-- Step 12: TimeStamp:", funcTimeString())
+  funcSyncPod()
   funcStopPod()
-  # Step 13 - Backup and sync pod volume(s)
-  print("\n-- Step 13: TimeStamp:", funcTimeString())
+  # Step 12 - Backup and sync pod volume(s)
+  print("\n-- Step 12: TimeStamp:", funcTimeString())
   funcVolSendRestore(vInputName,"pod")
-  # Step 14 - Create containers on remote server.
-  print("\n-- Step 14: TimeStamp:", funcTimeString())
+  # Step 13 - Create containers on remote server.
+  print("\n-- Step 13: TimeStamp:", funcTimeString())
   funcSyncPodContainers()
-  # Step 15 - Start remote pod.
-  print("\n-- Step 15: TimeStamp:", funcTimeString())
+  # Step 14 - Start remote pod.
+  print("\n-- Step 14: TimeStamp:", funcTimeString())
   funcStartPod(vInputName, 20)
-  # Step 16 - Clean folder only if vCleanMigrateDir set to Yes.
-  print("\n-- Step 16 TimeStamp:", funcTimeString())
-  funcCleanLocalMigrateFolder()
-  # Step 17 - Clean folder only if vCleanMigrateDir set to Yes.
-  print("\n-- Step 17 TimeStamp:", funcTimeString())
-  funcCleanRemoteMigrateFolder()
-  # Step 18 - End SFTP connection.
-  print("\n-- Step 18 TimeStamp:", funcTimeString())
+  # Step 15 - End SFTP connection.
+  print("\n-- Step 15 TimeStamp:", funcTimeString())
   funcSftpClose()
-  # Step 19 - Finally done.
-  print("\n-- Step 19: TimeStamp:", funcTimeString())
+  # Step 16 - Finally done.
+  print("\n-- Step 16: TimeStamp:", funcTimeString())
   funcEndMessage()
 
 ### Function - Main